@@ -3,6 +3,9 @@ import json
 import os
 import datetime
 import ast
+import gzip
+import hashlib
+import zlib
 
 def download_data(file_path, default_data):
     if not os.path.exists(file_path):
@@ -15,6 +18,24 @@ def upload_data(file_path, data):
     with open(file_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=4)
 
+def normalize_text(value):
+    return ' '.join(str(value or '').lower().split())
+
+def normalize_phone(phone):
+    digits = ''.join(ch for ch in str(phone or '') if ch.isdigit())
+    if len(digits) == 11 and digits.startswith('8'):
+        digits = '7' + digits[1:]
+    return digits
+
+def normalize_date(date):
+    try:
+        return datetime.datetime.strptime(str(date).strip(), '%d-%m-%Y').strftime('%d-%m-%Y')
+    except ValueError:
+        return normalize_text(date)
+
+def make_fingerprint(*parts):
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
 NOTES_FILE = 'notes.json'
 
 class Note:
@@ -27,11 +48,29 @@ class Note:
 class NoteManager:
     def __init__(self):
         self.notes = []
+        self.fingerprints = {}
         self.load_notes()
 
     def load_notes(self):
         data = download_data(NOTES_FILE, [])
         self.notes = [Note(**note) for note in data]
+        self.fingerprints = {}
+        for note in self.notes:
+            self.index_note(note)
+
+    def note_fingerprint(self, note):
+        return make_fingerprint(normalize_text(note.title), normalize_text(note.content))
+
+    def index_note(self, note):
+        self.fingerprints.setdefault(self.note_fingerprint(note), []).append(note)
+
+    def unindex_note(self, note):
+        key = self.note_fingerprint(note)
+        matches = self.fingerprints.get(key, [])
+        if note in matches:
+            matches.remove(note)
+        if not matches:
+            self.fingerprints.pop(key, None)
 
     def save_notes(self):
         data = [note.__dict__ for note in self.notes]
@@ -42,6 +81,7 @@ class NoteManager:
         timestamp = datetime.datetime.now().strftime('%d-%m-%Y %H:%M:%S')
         new_note = Note(note_id, title, content, timestamp)
         self.notes.append(new_note)
+        self.index_note(new_note)
         self.save_notes()
         print('Заметка добавлена!')
 
@@ -64,9 +104,11 @@ class NoteManager:
     def edit_note(self, note_id, new_title, new_content):
         note = self.get_note(note_id)
         if note:
+            self.unindex_note(note)
             note.title = new_title
             note.content = new_content
             note.timestamp = datetime.datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+            self.index_note(note)
             self.save_notes()
             print('Заметка обновлена!')
         else:
@@ -76,6 +118,7 @@ class NoteManager:
         note = self.get_note(note_id)
         if note:
             self.notes.remove(note)
+            self.unindex_note(note)
             self.save_notes()
             print('Заметка удалена!')
         else:
@@ -110,17 +153,39 @@ class NoteManager:
         if not os.path.exists(file_name):
             print('Файл отсутствует')
             return
+        note_id = max([note.id for note in self.notes], default=0) + 1
+        added = 0
+        skipped = 0
         with open(file_name, mode='r', encoding='utf-8') as csv_file:
             reader = csv.DictReader(csv_file)
             for row in reader:
-                note_id = max([note.id for note in self.notes], default=0) + 1
                 title = row.get('Заголовок', '')
                 content = row.get('Содержимое', '')
                 timestamp = row.get('Дата', datetime.datetime.now().strftime('%d-%m-%Y %H:%M:%S'))
                 new_note = Note(note_id, title, content, timestamp)
+                if self.note_fingerprint(new_note) in self.fingerprints:
+                    skipped += 1
+                    continue
                 self.notes.append(new_note)
+                self.index_note(new_note)
+                note_id += 1
+                added += 1
+            self.save_notes()
+        print(f'Заметки импортированы из CSV-файла (добавлено: {added}, пропущено дубликатов: {skipped})')
+
+    def dedup_notes(self):
+        self.fingerprints = {}
+        unique_notes = []
+        for note in self.notes:
+            if self.note_fingerprint(note) in self.fingerprints:
+                continue
+            unique_notes.append(note)
+            self.index_note(note)
+        removed = len(self.notes) - len(unique_notes)
+        self.notes = unique_notes
+        if removed:
             self.save_notes()
-        print('Заметки импортированы из CSV-файла')
+        print(f'Удалено дубликатов: {removed}')
 
 def notes_menu():
     manager = NoteManager()
@@ -134,6 +199,7 @@ def notes_menu():
         print('5. Удалить заметку')
         print('6. Экспорт заметок в CSV')
         print('7. Импорт заметок из CSV')
+        print('9. Удалить дубликаты')
         print('8. Назад')
         choice = input('Выберите действие: ')
         if choice == '1':
@@ -168,6 +234,8 @@ def notes_menu():
             manager.import_notes()
         elif choice == '8':
             break
+        elif choice == '9':
+            manager.dedup_notes()
         else:
             print('Некорректный ввод. Попробуйте снова')
 
@@ -185,11 +253,29 @@ class Task:
 class TaskManager:
     def __init__(self):
         self.tasks = []
+        self.fingerprints = {}
         self.download_tasks()
 
     def download_tasks(self):
         data = download_data(TASKS_FILE, [])
         self.tasks = [Task(**task) for task in data]
+        self.fingerprints = {}
+        for task in self.tasks:
+            self.index_task(task)
+
+    def task_fingerprint(self, task):
+        return make_fingerprint(normalize_text(task.title), normalize_text(task.description), normalize_date(task.due_date))
+
+    def index_task(self, task):
+        self.fingerprints.setdefault(self.task_fingerprint(task), []).append(task)
+
+    def unindex_task(self, task):
+        key = self.task_fingerprint(task)
+        matches = self.fingerprints.get(key, [])
+        if task in matches:
+            matches.remove(task)
+        if not matches:
+            self.fingerprints.pop(key, None)
 
     def upload_tasks(self):
         data = [task.__dict__ for task in self.tasks]
@@ -199,6 +285,7 @@ class TaskManager:
         task_id = max([task.id for task in self.tasks], default=0) + 1
         new_task = Task(task_id, title, description, False, priority, due_date)
         self.tasks.append(new_task)
+        self.index_task(new_task)
         self.upload_tasks()
         print('Задача добавлена!')
 
@@ -227,10 +314,12 @@ class TaskManager:
     def edit_task(self, task_id, title, description, priority, due_date):
         task = self.get_task(task_id)
         if task:
+            self.unindex_task(task)
             task.title = title
             task.description = description
             task.priority = priority
             task.due_date = due_date
+            self.index_task(task)
             self.upload_tasks()
             print('Задача обновлена!')
         else:
@@ -240,6 +329,7 @@ class TaskManager:
         task = self.get_task(task_id)
         if task:
             self.tasks.remove(task)
+            self.unindex_task(task)
             self.upload_tasks()
             print('Задача удалена!')
         else:
@@ -276,10 +366,12 @@ class TaskManager:
         if not os.path.exists(file_name):
             print('Файл отсутствует')
             return
+        task_id = max([task.id for task in self.tasks], default=0) + 1
+        added = 0
+        skipped = 0
         with open(file_name, mode='r', encoding='utf-8') as csv_file:
             reader = csv.DictReader(csv_file)
             for row in reader:
-                task_id = max([task.id for task in self.tasks], default=0) + 1
                 title = row.get('Название', '')
                 description = row.get('Описание', '')
                 status = row.get('Статус', 'Не выполнена')
@@ -287,9 +379,29 @@ class TaskManager:
                 priority = row.get('Приоритет', 'Средний')
                 due_date = row.get('Срок выполнения', None)
                 new_task = Task(task_id, title, description, done, priority, due_date)
+                if self.task_fingerprint(new_task) in self.fingerprints:
+                    skipped += 1
+                    continue
                 self.tasks.append(new_task)
+                self.index_task(new_task)
+                task_id += 1
+                added += 1
+            self.upload_tasks()
+        print(f'Задачи  импортированы из CSV-файла (добавлено: {added}, пропущено дубликатов: {skipped})')
+
+    def dedup_tasks(self):
+        self.fingerprints = {}
+        unique_tasks = []
+        for task in self.tasks:
+            if self.task_fingerprint(task) in self.fingerprints:
+                continue
+            unique_tasks.append(task)
+            self.index_task(task)
+        removed = len(self.tasks) - len(unique_tasks)
+        self.tasks = unique_tasks
+        if removed:
             self.upload_tasks()
-        print('Задачи  импортированы из CSV-файла')
+        print(f'Удалено дубликатов: {removed}')
 
 def tasks_menu():
     manager = TaskManager()
@@ -302,6 +414,7 @@ def tasks_menu():
         print('5. Удалить задачу')
         print('6. Экспорт задач в CSV')
         print('7. Импорт задач из CSV')
+        print('9. Удалить дубликаты')
         print('8. Назад')
         choice = input('Выберите действие: ')
         if choice == '1':
@@ -340,6 +453,8 @@ def tasks_menu():
             manager.import_tasks()
         elif choice == '8':
             break
+        elif choice == '9':
+            manager.dedup_tasks()
         else:
             print('Некорректный ввод. Попробуйте снова')
 
@@ -356,11 +471,78 @@ class Contact:
 class ContactManager:
     def __init__(self):
         self.contacts = []
+        self.fingerprints = {}
         self.download_contacts()
 
     def download_contacts(self):
         data = download_data(CONTACTS_FILE, [])
         self.contacts = [Contact(**contact) for contact in data]
+        self.fingerprints = {}
+        for contact in self.contacts:
+            self.index_contact(contact)
+
+    def contact_fingerprints(self, contact):
+        keys = []
+        phone = normalize_phone(contact.phone)
+        if phone:
+            keys.append(make_fingerprint('phone', phone))
+        email = normalize_text(contact.email)
+        if email:
+            keys.append(make_fingerprint('email', email))
+        name = normalize_text(contact.name)
+        if not keys and name:
+            keys.append(make_fingerprint('name', name))
+        return keys
+
+    def index_contact(self, contact):
+        for key in self.contact_fingerprints(contact):
+            self.fingerprints.setdefault(key, []).append(contact)
+
+    def unindex_contact(self, contact):
+        for key in self.contact_fingerprints(contact):
+            matches = self.fingerprints.get(key, [])
+            if contact in matches:
+                matches.remove(contact)
+            if not matches:
+                self.fingerprints.pop(key, None)
+
+    def contact_candidates(self, contact):
+        candidates = []
+        for key in self.contact_fingerprints(contact):
+            for candidate in self.fingerprints.get(key, []):
+                if candidate is not contact and candidate not in candidates:
+                    candidates.append(candidate)
+        return candidates
+
+    def contacts_compatible(self, first, second):
+        for field, normalize in (('name', normalize_text), ('phone', normalize_phone), ('email', normalize_text)):
+            first_value = normalize(getattr(first, field))
+            second_value = normalize(getattr(second, field))
+            if first_value and second_value and first_value != second_value:
+                return False
+        return True
+
+    def find_duplicate_contact(self, contact):
+        for candidate in self.contact_candidates(contact):
+            if self.contacts_compatible(candidate, contact):
+                return candidate
+        return None
+
+    def report_possible_duplicates(self, contact):
+        candidates = self.contact_candidates(contact)
+        for candidate in candidates:
+            print(f'Возможный дубликат: {contact.name} (ID {contact.id}) и {candidate.name} (ID {candidate.id})')
+        return bool(candidates)
+
+    def merge_contact(self, target, source):
+        self.unindex_contact(target)
+        merged = False
+        for field in ('name', 'phone', 'email'):
+            if not getattr(target, field) and getattr(source, field):
+                setattr(target, field, getattr(source, field))
+                merged = True
+        self.index_contact(target)
+        return merged
 
     def upload_contacts(self):
         data = [contact.__dict__ for contact in self.contacts]
@@ -370,6 +552,7 @@ class ContactManager:
         contact_id = max([contact.id for contact in self.contacts], default=0) + 1
         new_contact = Contact(contact_id, name, phone, email)
         self.contacts.append(new_contact)
+        self.index_contact(new_contact)
         self.upload_contacts()
         print('Контакт добавлен!')
 
@@ -384,9 +567,11 @@ class ContactManager:
     def edit_contact(self, contact_id, name, phone, email):
         contact = self.get_contact(contact_id)
         if contact:
+            self.unindex_contact(contact)
             contact.name = name
             contact.phone = phone
             contact.email = email
+            self.index_contact(contact)
             self.upload_contacts()
             print('Контакт обновлён!')
         else:
@@ -396,6 +581,7 @@ class ContactManager:
         contact = self.get_contact(contact_id)
         if contact:
             self.contacts.remove(contact)
+            self.unindex_contact(contact)
             self.upload_contacts()
             print('Контакт удалён!')
         else:
@@ -430,17 +616,50 @@ class ContactManager:
         if not os.path.exists(file_name):
             print('Файл отсутствует')
             return
+        contact_id = max([contact.id for contact in self.contacts], default=0) + 1
+        added = 0
+        merged = 0
+        skipped = 0
+        possible = 0
         with open(file_name, mode='r', encoding='utf-8') as csv_file:
             reader = csv.DictReader(csv_file)
             for row in reader:
-                contact_id = max([contact.id for contact in self.contacts], default=0) + 1
                 name = row.get('Имя', '')
                 phone = row.get('Телефон', '')
                 email = row.get('E-mail', '')
                 new_contact = Contact(contact_id, name, phone, email)
+                duplicate = self.find_duplicate_contact(new_contact)
+                if duplicate:
+                    if self.merge_contact(duplicate, new_contact):
+                        merged += 1
+                    else:
+                        skipped += 1
+                    continue
+                if self.report_possible_duplicates(new_contact):
+                    possible += 1
                 self.contacts.append(new_contact)
+                self.index_contact(new_contact)
+                contact_id += 1
+                added += 1
             self.upload_contacts()
-        print('Контакты импортированы из CSV-файла')
+        print(f'Контакты импортированы из CSV-файла (добавлено: {added}, объединено: {merged}, пропущено дубликатов: {skipped}, возможных дубликатов: {possible})')
+
+    def dedup_contacts(self):
+        self.fingerprints = {}
+        unique_contacts = []
+        for contact in self.contacts:
+            duplicate = self.find_duplicate_contact(contact)
+            if duplicate:
+                self.merge_contact(duplicate, contact)
+                continue
+            self.report_possible_duplicates(contact)
+            unique_contacts.append(contact)
+            self.index_contact(contact)
+        removed = len(self.contacts) - len(unique_contacts)
+        self.contacts = unique_contacts
+        if removed:
+            self.upload_contacts()
+        print(f'Удалено дубликатов: {removed}')
 
 def contacts_menu():
     manager = ContactManager()
@@ -452,6 +671,7 @@ def contacts_menu():
         print('4. Удалить контакт')
         print('5. Экспорт контактов в CSV')
         print('6. Импорт контактов из CSV')
+        print('8. Удалить дубликаты')
         print('7. Назад')
         choice = input('Выберите действие: ')
         if choice == '1':
@@ -483,6 +703,8 @@ def contacts_menu():
             manager.import_contacts()
         elif choice == '7':
             break
+        elif choice == '8':
+            manager.dedup_contacts()
         else:
             print('Некорректный ввод. Попробуйте снова')
 
@@ -499,11 +721,29 @@ class FinanceRecord:
 class FinanceManager:
     def __init__(self):
         self.records = []
+        self.fingerprints = {}
         self.download_records()
 
     def download_records(self):
         data = download_data(FINANCE_FILE, [])
         self.records = [FinanceRecord(**record) for record in data]
+        self.fingerprints = {}
+        for record in self.records:
+            self.index_record(record)
+
+    def record_fingerprint(self, record):
+        return make_fingerprint(normalize_date(record.date), f'{float(record.amount):.2f}', normalize_text(record.description))
+
+    def index_record(self, record):
+        self.fingerprints.setdefault(self.record_fingerprint(record), []).append(record)
+
+    def unindex_record(self, record):
+        key = self.record_fingerprint(record)
+        matches = self.fingerprints.get(key, [])
+        if record in matches:
+            matches.remove(record)
+        if not matches:
+            self.fingerprints.pop(key, None)
 
     def upload_records(self):
         data = [record.__dict__ for record in self.records]
@@ -513,6 +753,7 @@ class FinanceManager:
         record_id = max([record.id for record in self.records], default=0) + 1
         new_record = FinanceRecord(record_id, amount, category, date, description)
         self.records.append(new_record)
+        self.index_record(new_record)
         self.upload_records()
         print('Запись добавлена!')
 
@@ -559,6 +800,7 @@ class FinanceManager:
         record = self.get_record(record_id)
         if record:
             self.records.remove(record)
+            self.unindex_record(record)
             self.upload_records()
             print('Запись удалена!')
         else:
@@ -594,18 +836,40 @@ class FinanceManager:
         if not os.path.exists(file_name):
             print('Файл отсутствует')
             return
+        record_id = max([record.id for record in self.records], default=0) + 1
+        added = 0
+        skipped = 0
         with open(file_name, mode='r', encoding='utf-8') as csv_file:
             reader = csv.DictReader(csv_file)
             for row in reader:
-                record_id = max([record.id for record in self.records], default=0) + 1
                 amount = float(row.get('Сумма', '0'))
                 category = row.get('Категория', '')
                 date = row.get('Дата', datetime.datetime.now().strftime('%d-%m-%Y'))
                 description = row.get('Описание', '')
                 new_record = FinanceRecord(record_id, amount, category, date, description)
+                if self.record_fingerprint(new_record) in self.fingerprints:
+                    skipped += 1
+                    continue
                 self.records.append(new_record)
+                self.index_record(new_record)
+                record_id += 1
+                added += 1
             self.upload_records()
-        print('Финансовые записи импортированы из CSV-файла')
+        print(f'Финансовые записи импортированы из CSV-файла (добавлено: {added}, пропущено дубликатов: {skipped})')
+
+    def dedup_records(self):
+        self.fingerprints = {}
+        unique_records = []
+        for record in self.records:
+            if self.record_fingerprint(record) in self.fingerprints:
+                continue
+            unique_records.append(record)
+            self.index_record(record)
+        removed = len(self.records) - len(unique_records)
+        self.records = unique_records
+        if removed:
+            self.upload_records()
+        print(f'Удалено дубликатов: {removed}')
 
 def finance_menu():
     manager = FinanceManager()
@@ -617,6 +881,7 @@ def finance_menu():
         print('4. Удалить запись')
         print('5. Экспорт финансовых записей в CSV')
         print('6. Импорт финансовых записей из CSV')
+        print('8. Удалить дубликаты')
         print('7. Назад')
         choice = input('Выберите действие: ')
         if choice == '1':
@@ -646,6 +911,181 @@ def finance_menu():
             manager.import_records()
         elif choice == '7':
             break
+        elif choice == '8':
+            manager.dedup_records()
+        else:
+            print('Некорректный ввод. Попробуйте снова')
+
+BACKUP_DIR = 'backups'
+BACKUP_OBJECTS_DIR = os.path.join(BACKUP_DIR, 'objects')
+BACKUP_MANIFEST = os.path.join(BACKUP_DIR, 'manifest.json')
+BACKUP_STORES = [NOTES_FILE, TASKS_FILE, CONTACTS_FILE, FINANCE_FILE]
+SNAPSHOT_INTERVAL = 10
+
+class BackupManager:
+    # Полный снимок раз в SNAPSHOT_INTERVAL копий, между ними — только изменения
+    def __init__(self):
+        os.makedirs(BACKUP_OBJECTS_DIR, exist_ok=True)
+        self.manifest = download_data(BACKUP_MANIFEST, {'backups': [], 'stores': {}})
+        self.manifest.setdefault('stores', {})
+
+    def save_manifest(self):
+        upload_data(BACKUP_MANIFEST, self.manifest)
+
+    def record_hash(self, record):
+        content = json.dumps(record, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def store_object(self, data):
+        content = json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = os.path.join(BACKUP_OBJECTS_DIR, f'{digest}.gz')
+        if not os.path.exists(object_path):
+            with open(object_path, 'wb') as f:
+                f.write(gzip.compress(content))
+        return digest
+
+    def load_object(self, digest):
+        object_path = os.path.join(BACKUP_OBJECTS_DIR, f'{digest}.gz')
+        if not os.path.exists(object_path):
+            raise ValueError(f'объект {digest} отсутствует')
+        with open(object_path, 'rb') as f:
+            compressed = f.read()
+        try:
+            content = gzip.decompress(compressed)
+        except (OSError, EOFError, zlib.error):
+            raise ValueError(f'объект {digest} повреждён')
+        if hashlib.sha256(content).hexdigest() != digest:
+            raise ValueError(f'контрольная сумма объекта {digest} не совпадает')
+        return json.loads(content.decode('utf-8'))
+
+    def collect_changes(self, is_snapshot):
+        files = {}
+        stores = {}
+        for file_path in BACKUP_STORES:
+            store = self.manifest['stores'].get(file_path)
+            if not is_snapshot:
+                if not store:
+                    raise ValueError(f'хэши хранилища {file_path} отсутствуют')
+                if os.path.exists(file_path):
+                    stat = os.stat(file_path)
+                    if store['mtime'] == stat.st_mtime_ns and store['size'] == stat.st_size:
+                        continue
+            records = download_data(file_path, [])
+            stat = os.stat(file_path)
+            hashes = {str(record['id']): self.record_hash(record) for record in records}
+            if is_snapshot:
+                files[file_path] = self.store_object(records)
+            else:
+                previous = self.load_object(store['hashes'])
+                changed = [record for record in records if previous.get(str(record['id'])) != hashes[str(record['id'])]]
+                removed = [record_id for record_id in previous if record_id not in hashes]
+                if changed or removed:
+                    files[file_path] = self.store_object({'changed': changed, 'removed': removed})
+            stores[file_path] = {
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'hashes': self.store_object(hashes)
+            }
+        return files, stores
+
+    def create_backup(self):
+        backups = self.manifest['backups']
+        backup_id = max([backup['id'] for backup in backups], default=0) + 1
+        since_snapshot = 0
+        for backup in reversed(backups):
+            if backup['type'] == 'snapshot':
+                break
+            since_snapshot += 1
+        is_snapshot = not backups or since_snapshot + 1 >= SNAPSHOT_INTERVAL
+        try:
+            files, stores = self.collect_changes(is_snapshot)
+        except ValueError as e:
+            print(f'Не удалось построить инкрементную копию ({e}), создаём полный снимок')
+            is_snapshot = True
+            files, stores = self.collect_changes(is_snapshot)
+        self.manifest['stores'].update(stores)
+        if not is_snapshot and not files:
+            self.save_manifest()
+            print('Изменений с последней резервной копии нет')
+            return
+        backup_type = 'snapshot' if is_snapshot else 'delta'
+        timestamp = datetime.datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+        backups.append({'id': backup_id, 'type': backup_type, 'timestamp': timestamp, 'files': files})
+        self.save_manifest()
+        if is_snapshot:
+            print(f'Создан полный снимок №{backup_id}')
+        else:
+            print(f'Создана инкрементная копия №{backup_id} (изменённых хранилищ: {len(files)})')
+
+    def list_backups(self):
+        if not self.manifest['backups']:
+            print('Резервные копии отсутствуют')
+            return
+        for backup in self.manifest['backups']:
+            backup_type = 'Снимок' if backup['type'] == 'snapshot' else 'Изменения'
+            print(f'{backup["id"]}. {backup["timestamp"]} [{backup_type}] (хранилищ: {len(backup["files"])})')
+
+    def apply_delta(self, records, delta):
+        removed = set(delta['removed'])
+        positions = {str(record['id']): index for index, record in enumerate(records)}
+        for record in delta['changed']:
+            index = positions.get(str(record['id']))
+            if index is None:
+                positions[str(record['id'])] = len(records)
+                records.append(record)
+            else:
+                records[index] = record
+        return [record for record in records if str(record['id']) not in removed]
+
+    def restore_backup(self, backup_id):
+        backups = self.manifest['backups']
+        target = None
+        for index, backup in enumerate(backups):
+            if backup['id'] == backup_id:
+                target = index
+                break
+        if target is None:
+            print('Резервная копия отсутствует')
+            return
+        start = target
+        while backups[start]['type'] != 'snapshot':
+            start -= 1
+        try:
+            state = {file_path: self.load_object(digest) for file_path, digest in backups[start]['files'].items()}
+            for backup in backups[start + 1:target + 1]:
+                for file_path, digest in backup['files'].items():
+                    state[file_path] = self.apply_delta(state.get(file_path, []), self.load_object(digest))
+        except ValueError as e:
+            print(f'Ошибка восстановления: {e}')
+            return
+        print('Сохраняем текущее состояние перед восстановлением...')
+        self.create_backup()
+        for file_path, records in state.items():
+            upload_data(file_path, records)
+        print(f'Данные восстановлены из резервной копии №{backup_id}')
+
+def backup_menu():
+    manager = BackupManager()
+    while True:
+        print('\nРезервное копирование:')
+        print('1. Создать резервную копию')
+        print('2. Просмотреть список резервных копий')
+        print('3. Восстановить данные из резервной копии')
+        print('4. Назад')
+        choice = input('Выберите действие: ')
+        if choice == '1':
+            manager.create_backup()
+        elif choice == '2':
+            manager.list_backups()
+        elif choice == '3':
+            try:
+                backup_id = int(input('Введите номер резервной копии: '))
+                manager.restore_backup(backup_id)
+            except ValueError:
+                print('ID отсутствует')
+        elif choice == '4':
+            break
         else:
             print('Некорректный ввод. Попробуйте снова')
 
@@ -672,6 +1112,7 @@ def main_menu():
         print('3. Управление контактами')
         print('4. Управление финансовыми записями')
         print('5. Калькулятор')
+        print('7. Резервное копирование')
         print('6. Выход')
         choice = input('Введите номер действия: ')
         if choice == '1':
@@ -687,6 +1128,8 @@ def main_menu():
         elif choice == '6':
             print('До свидания!')
             break
+        elif choice == '7':
+            backup_menu()
         else:
             print('Некорректный ввод. Попробуйте снова')
 